@@ -1585,7 +1585,7 @@ export const fetchMeterReadings = functions
 
         // 3. Save readings to bill/readings subcollection (for invoice calculations)
         // Get units to map unit numbers to unit IDs
-        const unitsSnapshot = await db.collection("units").get();
+        const unitsSnapshot = await db.collection("units").select("name", "submeter_id").get();
         const unitsByNumber = new Map<string, { id: string; submeter_id: string }>();
         
         for (const unitDoc of unitsSnapshot.docs) {
@@ -1901,7 +1901,7 @@ export const populateBillReadings = functions
         console.log(`Saved meter_readings to bill ${billId}`);
 
         // 3. Save readings to bill/readings subcollection (for invoice calculations)
-        const unitsSnapshot = await db.collection("units").get();
+        const unitsSnapshot = await db.collection("units").select("name", "submeter_id").get();
         const unitsByNumber = new Map<string, { id: string; submeter_id: string }>();
         
         for (const unitDoc of unitsSnapshot.docs) {
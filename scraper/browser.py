@@ -1,7 +1,63 @@
 """Shared browser configuration for the Playwright scrapers."""
 
+import atexit
+import threading
+from typing import TYPE_CHECKING, Collection, Dict
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, Playwright
+
 # Seattle's WAF serves a bot block page to Playwright's default HeadlessChrome UA.
 USER_AGENT = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36"
 )
+
+# Chromium is launched once and shared by every scraper; each scraper opens its
+# own BrowserContext on it. Playwright's sync API is bound to the thread that
+# started it and refuses a second instance there, so the shared state is per
+# thread (i.e. one per process under gunicorn's sync workers).
+_shared = threading.local()
+
+
+def _stop_playwright(playwright: "Playwright", browsers: Dict[bool, "Browser"]):
+    """atexit hook for the shared browsers; best effort since the process is exiting."""
+    try:
+        for browser in browsers.values():
+            browser.close()
+        playwright.stop()
+    except Exception:
+        pass
+
+
+def shared_browser(headless: bool = True) -> "Browser":
+    """Return this thread's shared Chromium, launching it on first use."""
+    browsers = getattr(_shared, "browsers", None)
+    if browsers is None:
+        from playwright.sync_api import sync_playwright
+
+        _shared.playwright = sync_playwright().start()
+        _shared.browsers = browsers = {}
+        atexit.register(_stop_playwright, _shared.playwright, browsers)
+
+    browser = browsers.get(headless)
+    if browser is None or not browser.is_connected():
+        browser = _shared.playwright.chromium.launch(
+            headless=headless,
+            args=["--disable-blink-features=AutomationControlled"],
+            ignore_default_args=["--enable-automation"],
+        )
+        browsers[headless] = browser
+    return browser
+
+
+def block_resources(context: "BrowserContext", resource_types: Collection[str]):
+    """Abort every request in the context for a resource type the scraper never uses."""
+
+    def route_request(route):
+        if route.request.resource_type in resource_types:
+            route.abort()
+        else:
+            route.continue_()
+
+    context.route("**/*", route_request)
@@ -0,0 +1,33 @@
+"""On-disk cache shared by the scrapers (auth tokens, sessions, API responses)."""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+# Survives across scraper instances (and across runs on a warm machine)
+CACHE_DIR = Path.home() / ".cache" / "utilitycollector"
+
+
+def user_cache_path(prefix: str, username: str) -> Path:
+    """Per-user cache file (username is hashed, not stored in the name)."""
+    user_hash = hashlib.sha256(username.encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{prefix}_{user_hash}.json"
+
+
+def write_cache_file(path: Path, data) -> bool:
+    """Atomically write JSON to a cache file readable only by the owner."""
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+        return True
+    except OSError as e:
+        log.warning(f"Could not write cache file {path}: {e}")
+        return False
@@ -26,7 +26,7 @@ initialize_app(
 db = firestore.client()
 bucket = storage.bucket()
 
-from browser import USER_AGENT
+from browser import USER_AGENT, shared_browser
 from parser import BillParser
 from scrapers.nextcentury_meters import NextCenturyError, NextCenturyMetersScraper
 
@@ -52,8 +52,6 @@ def debug_login():
     """
     import time
 
-    from playwright.sync_api import sync_playwright
-
     try:
         # Get credentials from Firestore
         creds = get_utility_credentials()
@@ -88,9 +86,9 @@ def debug_login():
 
         # Start browser
         debug_info["steps"].append("Starting Playwright...")
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(user_agent=USER_AGENT)
+        # The worker's shared Chromium: a second sync Playwright can't start in
+        # the same thread while the scrapers' instance is running
+        with shared_browser().new_context(user_agent=USER_AGENT) as context:
             page = context.new_page()
 
             debug_info["steps"].append("Navigating to NextCentury...")
@@ -201,8 +199,6 @@ def debug_login():
             debug_info["final_state"]["url"] = page.url
             debug_info["final_state"]["title"] = page.title()
 
-            browser.close()
-
         return jsonify(debug_info)
 
     except Exception as e:
@@ -417,8 +413,10 @@ def refresh_bill():
             parser = BillParser()
             parsed_data = parser.parse(str(pdf_path))
             
-            # Update the bill in Firestore
-            db.collection("bills").document(bill_id).update({
+            # Update the bill and its adjustments in one batched commit
+            bill_ref = db.collection("bills").document(bill_id)
+            batch = db.batch()
+            batch.update(bill_ref, {
                 "services": parsed_data["services"],  # Flattened - no more parsed_data wrapper
                 "due_date": parsed_data["due_date"],
                 "total_amount": parsed_data["total"],
@@ -432,19 +430,21 @@ def refresh_bill():
             
             if has_adjustments:
                 # Clear existing adjustments and re-add
-                adjustments_ref = db.collection("bills").document(bill_id).collection("adjustments")
+                adjustments_ref = bill_ref.collection("adjustments")
                 for adj_doc in adjustments_ref.stream():
-                    adj_doc.reference.delete()
+                    batch.delete(adj_doc.reference)
                 
                 adjustments = extract_adjustments(parsed_data)
                 for adj in adjustments:
-                    adjustments_ref.add({
+                    batch.set(adjustments_ref.document(), {
                         "description": adj["description"],
                         "cost": adj["cost"],
                         "date": adj.get("date"),
                         "assigned_unit_ids": [],
                     })
             
+            batch.commit()
+            
             log.info(f"Successfully refreshed bill {bill_id}")
             
             return jsonify({
@@ -521,6 +521,14 @@ def scrape_seattle_utilities(force_update: bool = False):
         bills = scraper.check_for_new_bills()
         total_checked = len(bills)
 
+        # One keys-only query for every stored bill instead of a get per candidate
+        existing_bill_ids = {
+            doc.id
+            for doc in db.collection("bills")
+            .select([firestore.FieldPath.document_id()])
+            .stream()
+        }
+
         for bill_info in bills:
             # Convert bill date to ISO format for document ID (e.g., "12/08/2024" -> "2024-12-08")
             # This ensures bills sort chronologically in Firebase console
@@ -528,13 +536,13 @@ def scrape_seattle_utilities(force_update: bool = False):
             bill_id = f"{date_parts[2]}-{date_parts[0]}-{date_parts[1]}"  # YYYY-MM-DD
             
             # Check if already exists in Firestore
-            existing_doc = db.collection("bills").document(bill_id).get()
+            bill_exists = bill_id in existing_bill_ids
 
-            if existing_doc.exists and not force_update:
+            if bill_exists and not force_update:
                 log.info(f"Bill {bill_info['date']} already exists, skipping")
                 continue
             
-            if existing_doc.exists and force_update:
+            if bill_exists and force_update:
                 # Update existing bill
                 log.info(f"Updating existing bill: {bill_info['date']}")
                 
@@ -542,8 +550,10 @@ def scrape_seattle_utilities(force_update: bool = False):
                 pdf_path = scraper.download_bill(bill_info["date"])
                 parsed_data = parser.parse(str(pdf_path))
                 
-                # Update the document
-                db.collection("bills").document(bill_id).update({
+                # Update the document and its adjustments in one batched commit
+                bill_ref = db.collection("bills").document(bill_id)
+                batch = db.batch()
+                batch.update(bill_ref, {
                     "services": parsed_data["services"],  # Flattened - no more parsed_data wrapper
                     "due_date": parsed_data["due_date"],
                     "total_amount": parsed_data["total"],
@@ -557,19 +567,21 @@ def scrape_seattle_utilities(force_update: bool = False):
                 
                 if has_adjustments:
                     # Clear existing adjustments and re-add
-                    adjustments_ref = db.collection("bills").document(bill_id).collection("adjustments")
+                    adjustments_ref = bill_ref.collection("adjustments")
                     for adj_doc in adjustments_ref.stream():
-                        adj_doc.reference.delete()
+                        batch.delete(adj_doc.reference)
                     
                     adjustments = extract_adjustments(parsed_data)
                     for adj in adjustments:
-                        adjustments_ref.add({
+                        batch.set(adjustments_ref.document(), {
                             "description": adj["description"],
                             "cost": adj["cost"],
                             "date": adj.get("date"),
                             "assigned_unit_ids": [],
                         })
                 
+                batch.commit()
+                
                 updated_bills.append({
                     "id": bill_id,
                     "date": bill_info["date"],
@@ -725,8 +737,10 @@ def save_new_bill_from_pdf(pdf_path: str, bill_date: str, parsed_data: dict = No
     )
     status = "NEEDS_REVIEW" if has_adjustments else "NEW"
 
+    # The bill and its adjustments go out in one batched commit
     bill_ref = db.collection("bills").document(bill_id)
-    bill_ref.set({
+    batch = db.batch()
+    batch.set(bill_ref, {
         "bill_date": bill_date,
         "due_date": parsed_data["due_date"],
         "total_amount": parsed_data["total"],
@@ -739,12 +753,13 @@ def save_new_bill_from_pdf(pdf_path: str, bill_date: str, parsed_data: dict = No
     })
 
     for adj in extract_adjustments(parsed_data):
-        bill_ref.collection("adjustments").add({
+        batch.set(bill_ref.collection("adjustments").document(), {
             "description": adj["description"],
             "cost": adj["cost"],
             "date": adj.get("date"),
             "assigned_unit_ids": [],
         })
+    batch.commit()
 
     return {
         "bill_id": bill_id,
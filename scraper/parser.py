@@ -5,12 +5,14 @@ Extracts structured data from Seattle Utilities bill PDFs.
 Adapted from the original bill_manager.py parsing logic.
 """
 
+import copy
+import hashlib
 import itertools
 import logging
-import math
 import re
+from collections import OrderedDict
 from datetime import datetime
-from functools import partial
+from io import BytesIO
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -19,24 +21,52 @@ from PyPDF2 import PdfReader
 
 log = logging.getLogger(__name__)
 
-# --- Regex Patterns ---
+# Text spans in other fonts are skipped during extraction
+BILL_FONTS = frozenset({"Arial-BoldMT", "ArialMT"})
 
-HEADER_REGEX = r"DUE DATE: (?P<due_date>[A-Za-z]+ \d{2}, \d{4})(?:.|\n)*Current billing: (?P<total>\d+\.\d{2})"
-BILL_DATE_REGEX = r"Summary of charges as of (?P<bill_date>[A-Za-z]+ \d{2}, \d{4})"
+# --- Regex Patterns (compiled once at import) ---
+
+HEADER_RE = re.compile(
+    r"DUE DATE: (?P<due_date>[A-Za-z]+ \d{2}, \d{4})[\s\S]*Current billing: (?P<total>\d+\.\d{2})"
+)
+BILL_DATE_RE = re.compile(r"Summary of charges as of (?P<bill_date>[A-Za-z]+ \d{2}, \d{4})")
 # Note: The "CR" suffix indicates a credit (negative amount) for service totals too
-SERVICE_REGEX = (
-    r"(?P<service>[A-Za-z ]+)(?P<bill>(?:.|\n)+?)Current \1: (?P<total>\d+\.\d{2})(?P<service_credit>\s*CR)?"
+SERVICE_RE = re.compile(
+    r"(?P<service>[A-Za-z ]+)(?P<bill>[\s\S]+?)Current \1: (?P<total>\d+\.\d{2})(?P<service_credit>\s*CR)?"
+)
+USAGE_RE = re.compile(
+    r"(?P<start_date>\w{3} \d{2}, \d{4}) (?P<end_date>\w{3} \d{2}, \d{4}) (?P<usage>\d+.\d{2})\*?(?: (?P<start_meter>\d+.\d{2})\*? (?P<end_meter>\d+.\d{2})\*?)?"
+)
+METER_RE = re.compile(
+    r"Meter Number: (?P<meter_number>[\w-]+) Service Category: ?(?P<service_category>\w*)"
 )
-USAGE_REGEX = r"(?P<start_date>\w{3} \d{2}, \d{4}) (?P<end_date>\w{3} \d{2}, \d{4}) (?P<usage>\d+.\d{2})\*?(?: (?P<start_meter>\d+.\d{2})\*? (?P<end_meter>\d+.\d{2})\*?)?"
-METER_REGEX = r"Meter Number: (?P<meter_number>[\w-]+) Service Category: ?(?P<service_category>\w*)"
 # Note: The "CR" suffix indicates a credit (negative amount)
-ITEM_REGEX = r"^(?:(?P<start>\w{3} \d{2}, \d{4}) (?P<end>\w{3} \d{2}, \d{4}) *)?(?P<description>.+?)\s*(?:(?P<date>\w{3} \d{2}, \d{4}) *)?(?:(?P<usage>\d+\.\d{2}) CCF @ \$(?P<rate>\d+.\d{2}) per CCF )?(?P<cost>\d+\.\d{2})(?P<credit>\s*CR)?"
-TRASH_REGEX = r"^(?P<count>\d+)-(?P<description>[\w /]+) (?P<size>\d+) Gal"
+ITEM_RE = re.compile(
+    r"^(?:(?P<start>\w{3} \d{2}, \d{4}) (?P<end>\w{3} \d{2}, \d{4}) *)?(?P<description>.+?)\s*(?:(?P<date>\w{3} \d{2}, \d{4}) *)?(?:(?P<usage>\d+\.\d{2}) CCF @ \$(?P<rate>\d+.\d{2}) per CCF )?(?P<cost>\d+\.\d{2})(?P<credit>\s*CR)?",
+    re.MULTILINE,
+)
+TRASH_RE = re.compile(r"^(?P<count>\d+)-(?P<description>[\w /]+) (?P<size>\d+) Gal")
+# Items and meter info share one pass over each meter group's text
+ITEM_OR_METER_RE = re.compile(
+    rf"(?:{ITEM_RE.pattern})|(?:{METER_RE.pattern})", re.MULTILINE
+)
+
+# _normalize_solid_waste_text line shapes
+TWO_DATES_RE = re.compile(r"^[A-Z][a-z]{2} \d{2}, \d{4}\s*[A-Z][a-z]{2} \d{2}, \d{4}")
+SINGLE_DATE_RE = re.compile(r"^[A-Z][a-z]{2} \d{2}, \d{4}")
+COST_ONLY_RE = re.compile(r"^\d+\.\d{2}$")
+CONTINUATION_RE = re.compile(r"^(Weekly|Week|Other|Every)$", re.IGNORECASE)
+TRAILING_COST_RE = re.compile(r"\d+\.\d{2}$")
 
 
 class BillParser:
     """Parses Seattle Utilities bill PDFs into structured data."""
 
+    # Parsed results keyed by a hash of the PDF bytes, shared by every parser in
+    # the process, so a bill that is re-downloaded unchanged isn't parsed again
+    PARSE_CACHE_SIZE = 32
+    _parse_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
     def parse(self, file_path: str) -> Dict[str, Any]:
         """
         Parse a bill PDF file and return structured data.
@@ -50,17 +80,57 @@ class BillParser:
             - total: float
             - services: dict of service data
         """
-        reader = PdfReader(file_path)
+        with open(file_path, "rb") as f:
+            pdf_bytes = f.read()
+
+        digest = hashlib.blake2b(pdf_bytes, digest_size=16).digest()
+        cached = self._parse_cache.get(digest)
+        if cached is not None:
+            log.info(f"Using cached parse of {file_path}")
+            self._parse_cache.move_to_end(digest)
+            return copy.deepcopy(cached)
+
+        parsed_data = self._parse_pdf(PdfReader(BytesIO(pdf_bytes)))
+
+        self._parse_cache[digest] = parsed_data
+        if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        # Callers may modify the result; keep the cached copy pristine
+        return copy.deepcopy(parsed_data)
 
-        # Parse header from first page
+    def _parse_pdf(self, reader: PdfReader) -> Dict[str, Any]:
+        """Extract and parse the header and service sections of a loaded PDF."""
         header: list[dict[str, Any]] = []
-        reader.pages[0].extract_text(visitor_text=partial(self._visitor_body, header))
+        body: list[dict[str, Any]] = []
+        parts = header
+
+        def visitor(text, _cm, tm, font_dict, _font_size):
+            """PDF text extraction visitor; appends to whichever list `parts` is."""
+            # Called for every text span, so bail on the cheap position test first
+            x = tm[4]
+            if x <= 240 or not font_dict:
+                return
+            font_name = font_dict["/BaseFont"].split("+")[-1]
+            if font_name in BILL_FONTS:
+                parts.append(
+                    {
+                        "text": text.replace("O00934", ""),
+                        "font": font_name,
+                        "size": tm[3],
+                        "x": x,
+                        "y": tm[5],
+                    }
+                )
+
+        # Parse header from first page (the returned text doesn't depend on the visitor,
+        # so it is reused for the bill date below instead of extracting page 0 twice)
+        first_page_text = reader.pages[0].extract_text(visitor_text=visitor)
         header_text = "\n".join([part["text"].strip() for part in header])
 
         # Parse body from remaining pages
-        body: list[dict[str, Any]] = []
+        parts = body
         for page in reader.pages[1:]:
-            page.extract_text(visitor_text=partial(self._visitor_body, body))
+            page.extract_text(visitor_text=visitor)
         body_text = "\n".join([part["text"].strip() for part in body])
 
         parsed_data = {
@@ -68,31 +138,16 @@ class BillParser:
             "services": self._parse_services(body_text),
         }
 
-        bill_date = self._parse_bill_date(reader.pages[0].extract_text())
+        bill_date = self._parse_bill_date(first_page_text)
         if bill_date:
             parsed_data["bill_date_detected"] = bill_date
 
         self._validate_bill(parsed_data)
         return parsed_data
 
-    def _visitor_body(self, parts, text, _cm, tm, font_dict, _font_size):
-        """PDF text extraction visitor function."""
-        size, x, y = tm[3], tm[4], tm[5]
-        font_name = font_dict["/BaseFont"].split("+")[-1] if font_dict else None
-        if x > 240 and (font_name == "Arial-BoldMT" or font_name == "ArialMT"):
-            parts.append(
-                {
-                    "text": text.replace("O00934", ""),
-                    "font": font_name,
-                    "size": size,
-                    "x": x,
-                    "y": y,
-                }
-            )
-
     def _parse_header(self, header_str: str) -> Dict[str, Any]:
         """Parse bill header to extract due date and total."""
-        match = re.search(HEADER_REGEX, header_str)
+        match = HEADER_RE.search(header_str)
         if not match:
             raise ValueError("Could not parse bill header.")
         return {
@@ -102,7 +157,7 @@ class BillParser:
 
     def _parse_bill_date(self, first_page_text: str) -> Optional[str]:
         """Detect the statement date, returned as MM/DD/YYYY, or None."""
-        match = re.search(BILL_DATE_REGEX, first_page_text)
+        match = BILL_DATE_RE.search(first_page_text)
         if not match:
             return None
         try:
@@ -115,7 +170,7 @@ class BillParser:
     def _parse_services(self, bill_str: str) -> Dict[str, Any]:
         """Parse all services from the bill body."""
         services = {}
-        for match in re.finditer(SERVICE_REGEX, bill_str):
+        for match in SERVICE_RE.finditer(bill_str):
             service_name = match.group("service")
             service_bill = match.group("bill")
             
@@ -152,28 +207,13 @@ class BillParser:
         
         This function joins lines that are continuations of previous items.
         """
-        lines = text.split('\n')
+        lines = [line for line in map(str.strip, text.splitlines()) if line]
         normalized: list[str] = []
         
-        # Pattern for TWO dates at start (complete item start)
-        # Matches: "Oct 01, 2025Nov 30, 2025" or "Oct 01, 2025 Nov 30, 2025"
-        two_dates_pattern = re.compile(
-            r'^[A-Z][a-z]{2} \d{2}, \d{4}\s*[A-Z][a-z]{2} \d{2}, \d{4}'
-        )
-        # Pattern for a single date at start (incomplete, needs joining)
-        single_date_pattern = re.compile(r'^[A-Z][a-z]{2} \d{2}, \d{4}')
-        # Pattern for just a cost
-        cost_only_pattern = re.compile(r'^\d+\.\d{2}$')
-        # Pattern for continuation words (frequency descriptors)
-        continuation_pattern = re.compile(r'^(Weekly|Week|Other|Every)$', re.IGNORECASE)
-        
         for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
             # Check if this starts a NEW complete item (has two dates)
-            if two_dates_pattern.match(line):
+            # Matches: "Oct 01, 2025Nov 30, 2025" or "Oct 01, 2025 Nov 30, 2025"
+            if TWO_DATES_RE.match(line):
                 normalized.append(line)
             elif not normalized:
                 # First line, just add it
@@ -182,14 +222,14 @@ class BillParser:
                 # Check if this is a continuation line that should be joined
                 is_continuation = (
                     # Just a cost number
-                    cost_only_pattern.match(line) or
+                    COST_ONLY_RE.match(line) or
                     # Frequency word continuation
-                    continuation_pattern.match(line) or
+                    CONTINUATION_RE.match(line) or
                     # Single date that's actually the END date for previous START date
                     # (previous line ended with a single date pattern without item description)
-                    (single_date_pattern.match(line) and
-                     not two_dates_pattern.match(normalized[-1]) and
-                     single_date_pattern.match(normalized[-1]))
+                    (SINGLE_DATE_RE.match(line) and
+                     not TWO_DATES_RE.match(normalized[-1]) and
+                     SINGLE_DATE_RE.match(normalized[-1]))
                 )
                 
                 if is_continuation:
@@ -198,7 +238,7 @@ class BillParser:
                 else:
                     # Check if previous line looks incomplete (single date only or missing cost)
                     prev_line = normalized[-1]
-                    prev_has_cost = bool(re.search(r'\d+\.\d{2}$', prev_line))
+                    prev_has_cost = bool(TRAILING_COST_RE.search(prev_line))
                     
                     if not prev_has_cost:
                         # Previous line is incomplete, join this line
@@ -211,76 +251,81 @@ class BillParser:
     def _parse_service_bill(self, bill_str: str) -> list:
         """Parse individual service billing details."""
         groups = []
-        splits = re.split(USAGE_REGEX, bill_str)
+        splits = USAGE_RE.split(bill_str)
 
         if len(splits) > 1:
             for meter_group in itertools.batched(splits[1:], 6):
                 start_date, end_date, usage, start_meter, end_meter, items_str = (
                     meter_group
                 )
-                groups.append(
-                    {
-                        "items": self._parse_items(items_str),
-                        "start_date": start_date,
-                        "end_date": end_date,
-                        "usage": float(usage),
-                        **({"start_meter": float(start_meter)} if start_meter else {}),
-                        **({"end_meter": float(end_meter)} if end_meter else {}),
-                        **self._parse_meter(items_str),
-                    }
-                )
+                items, meter = self._parse_items_and_meter(items_str)
+                group: Dict[str, Any] = {
+                    "items": items,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "usage": float(usage),
+                }
+                if start_meter:
+                    group["start_meter"] = float(start_meter)
+                if end_meter:
+                    group["end_meter"] = float(end_meter)
+                group.update(meter)
+                groups.append(group)
         else:
-            items_str = splits[0]
-            groups.append(
-                {"items": self._parse_items(items_str), **self._parse_meter(items_str)}
-            )
+            items, meter = self._parse_items_and_meter(splits[0])
+            groups.append({"items": items, **meter})
 
         return groups
 
-    def _parse_items(self, bill_str: str) -> list:
-        """Parse line items from a service section."""
+    def _parse_items_and_meter(self, bill_str: str) -> tuple[list, Dict[str, str]]:
+        """Parse line items and meter information from a service section."""
         items = []
-        for match in re.finditer(ITEM_REGEX, bill_str, re.MULTILINE):
+        meter: Dict[str, str] = {}
+        for match in ITEM_OR_METER_RE.finditer(bill_str):
+            if match.group("meter_number") is not None:
+                if not meter:
+                    meter = self._meter_info(match)
+                continue
+
+            # A meter line directly above a usage line is consumed as an item
+            # description, so look for the meter inside it as well
+            if not meter and "Meter Number: " in match.group("description"):
+                meter_match = METER_RE.search(match.group("description"))
+                if meter_match:
+                    meter = self._meter_info(meter_match)
+
             # Parse cost, making it negative if "CR" (credit) suffix is present
             cost = float(match.group("cost"))
             is_credit = match.group("credit") is not None
             if is_credit:
                 cost = -cost  # Credits are negative amounts
             
-            items.append(
-                self._parse_trash(
-                    {
-                        "description": match.group("description")
-                        .replace("\n", " ")
-                        .strip(),
-                        "cost": cost,
-                        **(
-                            {"start": match.group("start")}
-                            if match.group("start")
-                            else {}
-                        ),
-                        **({"end": match.group("end")} if match.group("end") else {}),
-                        **(
-                            {"date": match.group("date")} if match.group("date") else {}
-                        ),
-                        **(
-                            {"usage": float(match.group("usage"))}
-                            if match.group("usage")
-                            else {}
-                        ),
-                        **(
-                            {"rate": float(match.group("rate"))}
-                            if match.group("rate")
-                            else {}
-                        ),
-                    }
-                )
-            )
-        return items
+            item: Dict[str, Any] = {
+                "description": match.group("description").replace("\n", " ").strip(),
+                "cost": cost,
+            }
+            if match.group("start"):
+                item["start"] = match.group("start")
+            if match.group("end"):
+                item["end"] = match.group("end")
+            if match.group("date"):
+                item["date"] = match.group("date")
+            if match.group("usage"):
+                item["usage"] = float(match.group("usage"))
+            if match.group("rate"):
+                item["rate"] = float(match.group("rate"))
+            items.append(self._parse_trash(item))
+        return items, meter
 
     def _parse_trash(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Parse trash service details from description."""
-        match = re.search(TRASH_REGEX, item["description"])
+        # Trash lines always start with the can count ("1-Garbage 20 Gal ..."),
+        # so skip everything else up front.
+        description = item["description"]
+        if not description[:1].isdigit():
+            return item
+
+        match = TRASH_RE.match(description)
         if match:
             return {
                 **item,
@@ -290,15 +335,12 @@ class BillParser:
             }
         return item
 
-    def _parse_meter(self, bill_str: str) -> Dict[str, str]:
-        """Parse meter information if present."""
-        meter = re.search(METER_REGEX, bill_str)
-        if meter:
-            return {
-                "meter_number": meter.group("meter_number"),
-                "service_category": meter.group("service_category"),
-            }
-        return {}
+    def _meter_info(self, match: re.Match) -> Dict[str, str]:
+        """Extract meter information from a METER_RE match."""
+        return {
+            "meter_number": match.group("meter_number"),
+            "service_category": match.group("service_category"),
+        }
 
     def _validate_bill(self, bill: Dict[str, Any]):
         """Validate parsed bill data for consistency."""
@@ -306,8 +348,10 @@ class BillParser:
             service_data["total"] for service, service_data in bill["services"].items()
         )
 
-        # Warn instead of crash - bill format may vary slightly
-        if not math.isclose(bill_total, bill["total"], rel_tol=0.05):
+        # Warn instead of crash - bill format may vary slightly.
+        # Comparisons below are math.isclose inlined (same relative tolerance).
+        header_total = bill["total"]
+        if abs(bill_total - header_total) > 0.05 * max(abs(bill_total), abs(header_total)):
             log.warning(
                 f"Bill total mismatch: services sum to {bill_total}, header says {bill['total']}"
             )
@@ -316,10 +360,14 @@ class BillParser:
             service_total = sum(
                 item["cost"] for part in service_data["parts"] for item in part["items"]
             )
+            expected_total = service_data["total"]
+            matches = abs(service_total - expected_total) <= 1e-9 * max(
+                abs(service_total), abs(expected_total)
+            )
 
             # For adjustments, log parsing issues but don't crash
             if "adjustment" in service.lower():
-                if not math.isclose(service_total, service_data["total"]):
+                if not matches:
                     items_found = [
                         f"{item['description']}: ${item['cost']}"
                         for part in service_data["parts"]
@@ -332,6 +380,6 @@ class BillParser:
                         f"Items found: {items_found}."
                     )
             else:
-                assert math.isclose(
-                    service_total, service_data["total"]
-                ), f"Service total mismatch {service}: {service_total} != {service_data['total']}"
+                assert (
+                    matches
+                ), f"Service total mismatch {service}: {service_total} != {expected_total}"
@@ -2,22 +2,86 @@
 NextCentury Meters Scraper
 
 Uses Playwright to login and extract JWT token, then calls the NextCentury API
-directly to get meter readings. This is more reliable than scraping the UI.
+directly (over a plain HTTP session) to get meter readings. This is more
+reliable than scraping the UI.
 """
 
+import base64
+import contextlib
+import functools
 import json
 import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-from playwright.sync_api import Browser, BrowserContext, Page, sync_playwright
+import requests
 
-from browser import USER_AGENT
+from browser import USER_AGENT, block_resources, shared_browser
+from cache import CACHE_DIR, user_cache_path, write_cache_file
+
+if TYPE_CHECKING:
+    # Playwright is imported lazily: runs with a cached JWT never touch it
+    from playwright.sync_api import BrowserContext, Locator, Page
 
 log = logging.getLogger(__name__)
 
+# 1 CCF (hundred cubic feet) = 748 US gallons
+GALLONS_PER_CCF = 748.0
+
+# Date formats tried after the ISO fast path, most common (bill PDF dates) first
+DATE_FORMATS = (
+    "%b %d, %Y",  # "Dec 01, 2024"
+    "%B %d, %Y",  # "December 01, 2024"
+    "%m/%d/%Y",  # "12/01/2024"
+    "%Y-%m-%d",  # "2024-12-1" (fromisoformat needs zero-padded fields)
+)
+
+
+def _read_response_cache(path: Path) -> Tuple[Optional[dict], Optional[float]]:
+    """
+    Read a cached API response written by _cache_response.
+
+    Returns:
+        Tuple of (entry with "body" and validators, age in seconds), or
+        (None, None) if there is no usable entry
+    """
+    try:
+        age = time.time() - path.stat().st_mtime
+        entry = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None, None
+    if not isinstance(entry, dict) or "body" not in entry:
+        return None, None
+    return entry, age
+
+
+def _cache_response(path: Path, response: requests.Response, body):
+    """Cache an API response body together with its ETag/Last-Modified."""
+    write_cache_file(
+        path,
+        {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body": body,
+        },
+    )
+
+
+def _conditional_headers(entry: Optional[dict]) -> Dict[str, str]:
+    """Request headers that let the server answer 304 for a cached entry."""
+    headers: Dict[str, str] = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
 
 class NextCenturyError(Exception):
     """Exception raised when NextCentury scraping fails."""
@@ -25,7 +89,13 @@ class NextCenturyError(Exception):
     pass
 
 
-@dataclass
+class _TokenRejected(NextCenturyError):
+    """The API answered 401 to a request that was not allowed to log in again."""
+
+    pass
+
+
+@dataclass(slots=True, frozen=True)
 class UnitReading:
     """Represents a meter reading for a unit."""
 
@@ -42,7 +112,8 @@ class NextCenturyMetersScraper:
 
     The approach:
     1. Login via browser to establish session and get JWT token from localStorage
-    2. Use the JWT token to call the API directly for data
+    2. Use the JWT token to call the API directly for data over a keep-alive
+       requests.Session (no round-trips through the Playwright driver)
 
     Usage:
         scraper = NextCenturyMetersScraper(username, password, property_id)
@@ -54,6 +125,18 @@ class NextCenturyMetersScraper:
 
     BASE_URL = "https://app.nextcenturymeters.com"
     API_URL = "https://api.nextcenturymeters.com/api"
+    REQUEST_TIMEOUT = 30  # seconds, matches Playwright's default request timeout
+    TOKEN_EXPIRY_MARGIN = 300  # seconds before `exp` at which a cached JWT is stale
+    TEMPLATE_CACHE_TTL = 24 * 60 * 60  # report template is effectively static config
+    # Concurrent RunReportTemplate POSTs in get_readings_for_bill_periods; stays
+    # below requests' default connection pool size (10) so sockets are reused
+    MAX_REPORT_WORKERS = 4
+
+    # Login only needs the form DOM and the localStorage write
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+    _TOKEN_JS = "() => localStorage.getItem('token')"
+    # Report dates are sent as midnight Pacific (standard time) in UTC
+    REPORT_TIME_SUFFIX = "T08:00:00.000Z"
 
     def __init__(self, username: str, password: str, property_id: str):
         """
@@ -68,26 +151,66 @@ class NextCenturyMetersScraper:
         self.password = password
         self.property_id = property_id
 
-        self._playwright = None
-        self._browser: Optional[Browser] = None
-        self._context: Optional[BrowserContext] = None
-        self._page: Optional[Page] = None
+        self._context: Optional["BrowserContext"] = None
+        self._page: Optional["Page"] = None
+        self._locators: Dict[str, "Locator"] = {}
         self._auth_token: Optional[str] = None
+        self._token_expires_at: Optional[float] = None
+        self._http: Optional[requests.Session] = None
+        self._template_cache: Optional[dict] = None
+        # Guards the token/session swap against reads from report worker threads
+        self._auth_lock = threading.Lock()
+
+        # Reuse a still-valid JWT from a previous run and skip the browser login
+        cached_token = self._load_cached_token()
+        if cached_token:
+            log.info("Using cached NextCentury auth token")
+            self._set_auth_token(cached_token)
 
     def _ensure_browser(self):
-        """Ensure browser is initialized."""
-        if self._browser is None:
-            self._playwright = sync_playwright().start()
-            self._browser = self._playwright.chromium.launch(headless=True)
-            self._context = self._browser.new_context(user_agent=USER_AGENT)
+        """Ensure this instance has a browser context and page."""
+        if self._context is None:
+            self._context = shared_browser().new_context(
+                user_agent=USER_AGENT,
+                java_script_enabled=True,
+                viewport={"width": 800, "height": 600},
+            )
+            block_resources(self._context, self.BLOCKED_RESOURCE_TYPES)
             self._page = self._context.new_page()
+            # Built once per page and reused throughout the login flow
+            self._locators = {
+                "email": self._page.locator('input[type="email"]'),
+                "password": self._page.locator('input[type="password"]'),
+                "submit": self._page.locator('button[type="submit"]'),
+            }
+
+    @contextlib.contextmanager
+    def _browser_session(self):
+        """Provide a browser context that is closed even if the body raises."""
+        self._ensure_browser()
+        try:
+            yield
+        finally:
+            self._close_context()
 
     def _login(self):
         """Log into NextCentury website and extract JWT token."""
         if self._auth_token:
             return
 
-        self._ensure_browser()
+        # The browser is only needed to obtain the token; everything after
+        # login is plain HTTP, so the context is released as soon as we're done.
+        with self._browser_session():
+            token = self._login_via_browser()
+
+        log.info("Auth token extracted successfully")
+        self._set_auth_token(token)
+        self._save_cached_token(token)
+
+    def _login_via_browser(self) -> str:
+        """Fill in the login form and return the JWT the app stores."""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
         assert self._page is not None
 
         log.info("Navigating to NextCentury...")
@@ -96,39 +219,35 @@ class NextCenturyMetersScraper:
         except Exception as e:
             raise NextCenturyError(f"Failed to connect to NextCentury website: {e}")
 
-        try:
-            self._page.wait_for_load_state("networkidle", timeout=25000)
-        except Exception as e:
-            log.warning(f"Timeout waiting for network idle: {e}")
-            # Continue anyway, page might be loaded enough
-
-        # Wait for the login form to appear - NextCentury is a SPA that renders dynamically
+        # Wait for the login form to appear - NextCentury is a SPA that renders
+        # dynamically. This is the readiness signal; networkidle is not needed.
         log.info("Waiting for login form to render...")
         try:
-            self._page.wait_for_selector('input[type="password"]', timeout=15000)
+            self._locators["password"].wait_for(timeout=15000)
             log.info("Login form found, logging in...")
 
             # Fill email - wait for it to be ready too
-            email_input = self._page.locator('input[type="email"]')
+            email_input = self._locators["email"]
             if email_input.count() == 0:
                 email_input = self._page.locator("input").first
             email_input.fill(self.username)
 
             # Fill password
-            self._page.locator('input[type="password"]').fill(self.password)
+            self._locators["password"].fill(self.password)
 
             # Submit
-            self._page.locator('button[type="submit"]').click()
+            self._locators["submit"].click()
 
-            # Wait for dashboard to load
+            # Wait for the app to store the token - that's all we need from the
+            # dashboard, so don't wait for it to render
             try:
-                self._page.wait_for_selector("text=Dashboard", timeout=15000)
+                self._page.wait_for_function(self._TOKEN_JS, timeout=15000)
                 log.info("Login successful!")
             except Exception:
                 # Try Enter key as fallback
                 try:
-                    self._page.locator('input[type="password"]').press("Enter")
-                    self._page.wait_for_selector("text=Dashboard", timeout=15000)
+                    self._locators["password"].press("Enter")
+                    self._page.wait_for_function(self._TOKEN_JS, timeout=15000)
                     log.info("Login successful!")
                 except Exception as e:
                     # Check for error messages on page
@@ -147,7 +266,7 @@ class NextCenturyMetersScraper:
                         raise NextCenturyError(f"Login failed: {error_text}")
                     else:
                         raise NextCenturyError(
-                            f"Login failed - could not reach Dashboard. Check username/password. Details: {e}"
+                            f"Login failed - no auth token after submit. Check username/password. Details: {e}"
                         )
         except Exception as e:
             # No login form found - might already be logged in, or page failed to load
@@ -156,15 +275,13 @@ class NextCenturyMetersScraper:
         # Wait for the app to store the token in localStorage
         log.info("Waiting for auth token...")
 
-        # Extract token from localStorage with retry (token may take a moment to be stored)
+        # The token may take a moment to be stored; return as soon as it is set
         token = None
-        for attempt in range(5):
-            token = self._page.evaluate("() => localStorage.getItem('token')")
-            if token:
-                log.info(f"Token found on attempt {attempt + 1}")
-                break
-            log.warning(f"Token not found on attempt {attempt + 1}, waiting...")
-            time.sleep(1)
+        try:
+            self._page.wait_for_function(self._TOKEN_JS, timeout=5000)
+            token = self._page.evaluate(self._TOKEN_JS)
+        except PlaywrightTimeoutError:
+            log.warning("Timed out waiting for auth token in localStorage")
 
         if not token:
             # Debug: list all localStorage keys
@@ -179,51 +296,114 @@ class NextCenturyMetersScraper:
                 }
             """
             )
-            log.error(f"No token found after retries. localStorage keys: {all_keys}")
+            log.error(f"No token found after waiting. localStorage keys: {all_keys}")
             raise NextCenturyError(
-                f"Login appeared successful but no auth token found after 5 retries. localStorage keys: {all_keys}"
+                f"Login appeared successful but no auth token found after 5s. localStorage keys: {all_keys}"
             )
 
+        return token
+
+    def _set_auth_token(self, token: str):
+        """Store the JWT and open the HTTP session that sends it."""
         self._auth_token = token
-        log.info("Auth token extracted successfully")
+        self._token_expires_at = self._token_expiry(token)
+        if self._http:
+            self._http.close()
+        self._http = requests.Session()
+        self._http.headers.update({"Authorization": token, "User-Agent": USER_AGENT})
+
+    @staticmethod
+    def _token_expiry(token: str) -> Optional[float]:
+        """Return the JWT's `exp` claim (epoch seconds) without verifying it."""
+        try:
+            payload = token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+            return float(claims["exp"])
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+
+    def _token_cache_path(self) -> Path:
+        """Per-user JWT cache file."""
+        return user_cache_path("nextcentury_token", self.username)
+
+    def _load_cached_token(self) -> Optional[str]:
+        """Return the cached JWT if it isn't about to expire."""
+        try:
+            cached = json.loads(self._token_cache_path().read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict):
+            return None
+        token = cached.get("token") if cached.get("username") == self.username else None
+        if not token:
+            return None
+        expires_at = self._token_expiry(token)
+        if expires_at is None or expires_at - time.time() <= self.TOKEN_EXPIRY_MARGIN:
+            return None
+        return token
+
+    def _save_cached_token(self, token: str):
+        """Write the JWT to the per-user cache file."""
+        write_cache_file(
+            self._token_cache_path(), {"username": self.username, "token": token}
+        )
 
-    def _get_units(self) -> List[dict]:
-        """Get all units for the property."""
+    def _invalidate_token(self):
+        """Forget the current JWT, both in memory and on disk."""
+        self._auth_token = None
+        self._token_expires_at = None
+        if self._http:
+            self._http.close()
+            self._http = None
+        try:
+            self._token_cache_path().unlink()
+        except OSError:
+            pass
+
+    def _ensure_valid_token(self):
+        """Log in if there is no token or the current one is about to expire."""
+        if (
+            self._auth_token
+            and self._token_expires_at is not None
+            and time.time() + self.TOKEN_EXPIRY_MARGIN >= self._token_expires_at
+        ):
+            # Refresh ahead of `exp` rather than eating a 401 per request
+            log.info("NextCentury auth token is about to expire; logging in again...")
+            self._invalidate_token()
         self._login()
-        assert self._page is not None
-        assert self._auth_token is not None
-
-        headers: Dict[str, str] = {"Authorization": self._auth_token}
-        url = f"{self.API_URL}/Properties/{self.property_id}/Units"
-
-        log.info(f"Fetching units from: {url}")
 
-        response = self._page.request.get(url, headers=headers)
-        if not response.ok:
-            if response.status == 401:
-                raise NextCenturyError(
-                    "Authentication expired or invalid. Please re-check credentials."
-                )
-            elif response.status == 404:
-                raise NextCenturyError(
-                    f"Property not found. Check property_id: {self.property_id}"
-                )
-            elif response.status == 403:
-                raise NextCenturyError(
-                    f"Access denied to property {self.property_id}. Check permissions."
-                )
-            else:
-                raise NextCenturyError(f"Failed to get units: HTTP {response.status}")
-
-        units = response.json()
-
-        if not units:
-            raise NextCenturyError(
-                f"No units found for property {self.property_id}. Check property configuration."
-            )
+    def _request(
+        self, method: str, url: str, *, login: bool = True, **kwargs
+    ) -> requests.Response:
+        """
+        Make an authenticated API request, logging in again once on HTTP 401
+        (e.g. a cached token that was revoked before its `exp`).
 
-        log.info(f"Found {len(units)} units for property {self.property_id}")
-        return units
+        With login=False a 401 raises _TokenRejected instead. Report worker
+        threads use this: the shared browser is per thread, so a login there
+        would launch a Chromium that nothing ever closes.
+        """
+        with self._auth_lock:
+            if login:
+                self._ensure_valid_token()
+            http, token = self._http, self._auth_token
+        if http is None:
+            raise _TokenRejected("No NextCentury auth token")
+
+        response = http.request(method, url, timeout=self.REQUEST_TIMEOUT, **kwargs)
+        if response.status_code == 401:
+            if not login:
+                raise _TokenRejected("NextCentury rejected the auth token")
+            with self._auth_lock:
+                # Another thread may already have replaced the rejected token
+                if self._auth_token == token:
+                    log.warning("NextCentury rejected the auth token; logging in again...")
+                    self._invalidate_token()
+                    self._login()
+                http = self._http
+            assert http is not None
+            response = http.request(method, url, timeout=self.REQUEST_TIMEOUT, **kwargs)
+        return response
 
     def get_current_readings(self, days: int = 60) -> Tuple[Dict[str, dict], List[str]]:
         """
@@ -239,15 +419,7 @@ class NextCenturyMetersScraper:
         to_date = datetime.now()
         from_date = to_date - timedelta(days=days)
         readings, warnings = self._get_readings_for_period(from_date, to_date)
-
-        result = {
-            r.unit_name: {
-                "gallons": r.usage_gallons,
-                "ccf": r.usage_ccf,
-            }
-            for r in readings
-        }
-        return result, warnings
+        return self._readings_by_unit(readings), warnings
 
     def get_readings_for_bill_period(
         self, bill_start_date: str, bill_end_date: str
@@ -271,27 +443,99 @@ class NextCenturyMetersScraper:
             raise NextCenturyError(f"Invalid date format: {e}")
 
         readings, warnings = self._get_readings_for_period(start_date, end_date)
+        return self._readings_by_unit(readings), warnings
+
+    def get_readings_for_bill_periods(
+        self, periods: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Tuple[Dict[str, dict], List[str]]]:
+        """
+        Get meter readings for several billing periods in one session.
 
-        result = {
+        Logs in and fetches the report template once, then runs the usage
+        reports for all periods concurrently over the shared HTTP session.
+        Logins only happen on the calling thread: periods whose report was
+        rejected with a 401 are resubmitted once after logging in again.
+
+        Args:
+            periods: List of (bill_start_date, bill_end_date) pairs, in any
+                format accepted by get_readings_for_bill_period
+
+        Returns:
+            Dictionary mapping each (bill_start_date, bill_end_date) pair to the
+            same (readings, warnings) tuple get_readings_for_bill_period returns
+        """
+        try:
+            parsed_periods = [
+                (self._parse_date(start), self._parse_date(end)) for start, end in periods
+            ]
+        except ValueError as e:
+            raise NextCenturyError(f"Invalid date format: {e}")
+
+        if not periods:
+            return {}
+
+        results = {}
+        pending = list(zip(periods, parsed_periods))
+        for attempt in range(2):
+            with self._auth_lock:
+                self._ensure_valid_token()
+            template = self._get_report_template()
+
+            # The report is computed server-side, so overlap the waits
+            workers = min(self.MAX_REPORT_WORKERS, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        self._get_readings_for_period, start_date, end_date, template,
+                        login=False,
+                    )
+                    for _, (start_date, end_date) in pending
+                ]
+
+            rejected = []
+            for item, future in zip(pending, futures):
+                try:
+                    readings, warnings = future.result()
+                except _TokenRejected:
+                    rejected.append(item)
+                    continue
+                results[item[0]] = (self._readings_by_unit(readings), warnings)
+
+            if not rejected:
+                break
+            if attempt:
+                raise NextCenturyError(
+                    "Authentication expired or invalid. Please re-check credentials."
+                )
+            log.warning("NextCentury rejected the auth token; logging in again...")
+            with self._auth_lock:
+                self._invalidate_token()
+            pending = rejected
+
+        return {period: results[period] for period in periods}
+
+    @staticmethod
+    def _readings_by_unit(readings: List[UnitReading]) -> Dict[str, dict]:
+        """Map unit names to their gallons/CCF usage."""
+        return {
             r.unit_name: {
                 "gallons": r.usage_gallons,
                 "ccf": r.usage_ccf,
             }
             for r in readings
         }
-        return result, warnings
 
-    def _parse_date(self, date_str: str) -> datetime:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_date(date_str: str) -> datetime:
         """Parse various date string formats into datetime."""
-        # Try different formats
-        formats = [
-            "%b %d, %Y",  # "Dec 01, 2024"
-            "%B %d, %Y",  # "December 01, 2024"
-            "%m/%d/%Y",  # "12/01/2024"
-            "%Y-%m-%d",  # "2024-12-01"
-        ]
+        # ISO dates ("2024-12-01") go through the C parser, no format matching
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
 
-        for fmt in formats:
+        for fmt in DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, fmt)
             except ValueError:
@@ -300,23 +544,83 @@ class NextCenturyMetersScraper:
         raise ValueError(f"Could not parse date: {date_str}")
 
     def _get_report_template(self) -> dict:
-        """Fetch the Usage report template from NextCentury."""
-        assert self._page is not None
-        assert self._auth_token is not None
+        """
+        Fetch the Usage report template from NextCentury.
+
+        The template is cached on the instance and on disk for
+        TEMPLATE_CACHE_TTL, then revalidated with If-None-Match. If the API
+        fails, a stale cached copy is used.
+        """
+        if self._template_cache is not None:
+            return self._template_cache
+
+        cache_path = CACHE_DIR / "rt_1.json"
+        cached, cache_age = _read_response_cache(cache_path)
+        if cached:
+            try:
+                self._report_columns(cached["body"])
+            except NextCenturyError:
+                # Never serve (or revalidate) a template we can't read reports with
+                cached = None
+
+        if cached and cache_age is not None and cache_age < self.TEMPLATE_CACHE_TTL:
+            self._template_cache = cached["body"]
+            return cached["body"]
 
-        headers: Dict[str, str] = {"Authorization": self._auth_token}
         url = f"{self.API_URL}/ReportTemplates/rt_1"
 
-        response = self._page.request.get(url, headers=headers)
-        if not response.ok:
+        response = self._request("GET", url, headers=_conditional_headers(cached))
+        if response.status_code == 304 and cached:
+            # Still current: restart the TTL without rewriting the body
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+            template = cached["body"]
+        elif not response.ok:
+            if cached:
+                log.warning(
+                    f"Failed to fetch report template (HTTP {response.status_code}); "
+                    "using stale cached copy"
+                )
+                self._template_cache = cached["body"]
+                return cached["body"]
             raise NextCenturyError(
-                f"Failed to fetch report template: HTTP {response.status}"
+                f"Failed to fetch report template: HTTP {response.status_code}"
             )
+        else:
+            template = json.loads(response.content)
+            self._report_columns(template)
+            _cache_response(cache_path, response, template)
+
+        self._template_cache = template
+        return template
 
-        return response.json()
+    @staticmethod
+    def _report_columns(template) -> Tuple[int, int, int]:
+        """Return the UNIT, METER_READ and METER_USAGE column indices of a report template."""
+        # Row cells are positional ({"value": ...}) with no inline header, but the
+        # template's columnSchemas defines the column order by key. Look up indices
+        # by key so we survive NextCentury reordering/adding columns on their side.
+        schemas = template.get("columnSchemas", []) if isinstance(template, dict) else []
+        column_keys = [c.get("key") for c in schemas]
+        try:
+            return (
+                column_keys.index("UNIT"),
+                column_keys.index("METER_READ"),
+                column_keys.index("METER_USAGE"),
+            )
+        except ValueError:
+            raise NextCenturyError(
+                f"Report template missing required columns. Got: {column_keys}"
+            )
 
     def _get_readings_for_period(
-        self, start_date: datetime, end_date: datetime
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        template: Optional[dict] = None,
+        login: bool = True,
     ) -> Tuple[List[UnitReading], List[str]]:
         """
         Get meter readings for a specific billing period using NextCentury's
@@ -326,102 +630,97 @@ class NextCenturyMetersScraper:
         Args:
             start_date: Period start date
             end_date: Period end date
+            template: Pre-fetched report template (fetched if not given)
+            login: Whether a rejected token may be replaced by logging in
+                here (see _request)
 
         Returns:
             Tuple of (List of UnitReading objects with usage data, List of warning messages)
         """
-        self._login()
-        assert self._page is not None
-        assert self._auth_token is not None
-
         # The RunReportTemplate API is inclusive on both start and end dates.
         # Seattle Utilities billing periods share boundary dates (bill 1 ends
         # Oct 08, bill 2 starts Oct 08), so we subtract one day from end_date
         # to avoid double-counting the boundary day.
         adjusted_end = end_date - timedelta(days=1)
-        from_str = start_date.strftime("%Y-%m-%dT08:00:00.000Z")
-        to_str = adjusted_end.strftime("%Y-%m-%dT08:00:00.000Z")
+        from_str = f"{start_date:%Y-%m-%d}{self.REPORT_TIME_SUFFIX}"
+        to_str = f"{adjusted_end:%Y-%m-%d}{self.REPORT_TIME_SUFFIX}"
 
-        log.info(f"Running usage report from {from_str} to {to_str}...")
+        log.info("Running usage report from %s to %s...", from_str, to_str)
 
-        headers: Dict[str, str] = {
-            "Authorization": self._auth_token,
-            "Content-Type": "application/json",
-        }
+        if template is None:
+            template = self._get_report_template()
 
-        template = self._get_report_template()
-
-        # Row cells are positional ({"value": ...}) with no inline header, but the
-        # template's columnSchemas defines the column order by key. Look up indices
-        # by key so we survive NextCentury reordering/adding columns on their side.
-        column_keys = [c.get("key") for c in template.get("columnSchemas", [])]
-        try:
-            unit_idx = column_keys.index("UNIT")
-            meter_read_idx = column_keys.index("METER_READ")
-            usage_idx = column_keys.index("METER_USAGE")
-        except ValueError:
-            raise NextCenturyError(
-                f"Report template missing required columns. Got: {column_keys}"
-            )
+        unit_idx, meter_read_idx, usage_idx = self._report_columns(template)
 
+        # Compact separators and pre-encoded bytes: the template is the bulk of
+        # the body, so skip the whitespace and let requests send it as-is
         payload = json.dumps(
             {
                 "template": template,
                 "startDate": from_str,
                 "endDate": to_str,
                 "contextId": self.property_id,
-            }
-        )
+            },
+            separators=(",", ":"),
+        ).encode()
 
-        response = self._page.request.post(
+        response = self._request(
+            "POST",
             f"{self.API_URL}/RunReportTemplate",
-            headers=headers,
+            headers={"Content-Type": "application/json"},
             data=payload,
+            login=login,
         )
 
         if not response.ok:
             raise NextCenturyError(
-                f"Failed to run usage report: HTTP {response.status}"
+                f"Failed to run usage report: HTTP {response.status_code}"
             )
 
-        report_rows = response.json()
-
-        readings = []
-        warnings = []
-        units_without_data = []
-
-        for row in report_rows:
-            unit_name = str(row[unit_idx]["value"])
-            meter_read = int(row[meter_read_idx]["value"])
-            usage_gallons = int(row[usage_idx]["value"])
-            usage_ccf = round(usage_gallons / 748.0, 2)
-
-            if usage_gallons == 0:
-                units_without_data.append(unit_name)
-
-            readings.append(
-                UnitReading(
-                    unit_id=f"u_{unit_name}",
-                    unit_name=unit_name,
-                    usage_gallons=usage_gallons,
-                    usage_ccf=usage_ccf,
-                    meter_read=meter_read,
-                )
+        # json.loads detects the UTF encoding from the raw bytes, skipping the
+        # decode-to-str step response.json() may take
+        report_rows = json.loads(response.content)
+
+        readings = [
+            UnitReading(
+                unit_id=f"u_{unit_name}",
+                unit_name=unit_name,
+                usage_gallons=usage_gallons,
+                usage_ccf=round(usage_gallons / GALLONS_PER_CCF, 2),
+                meter_read=int(row[meter_read_idx]["value"]),
             )
+            for row in report_rows
+            for unit_name in [str(row[unit_idx]["value"])]
+            for usage_gallons in [int(row[usage_idx]["value"])]
+        ]
+        warnings = []
+        units_without_data = [r.unit_name for r in readings if r.usage_gallons == 0]
 
-            log.info(f"  {unit_name}: {usage_ccf:.2f} CCF ({usage_gallons} gallons)")
+        log.info("Got usage for %d units", len(readings))
+        if log.isEnabledFor(logging.DEBUG):
+            for r in readings:
+                log.debug(
+                    "  %s: %.2f CCF (%d gallons)", r.unit_name, r.usage_ccf, r.usage_gallons
+                )
 
         if units_without_data:
             warnings.append(f"Zero usage for period: {', '.join(units_without_data)}")
 
         return readings, warnings
 
+    def _close_context(self):
+        """Close this instance's browser context. The shared browser stays up."""
+        if self._context:
+            self._context.close()
+            self._context = None
+            self._page = None
+            self._locators = {}
+
     def close(self):
-        """Close the browser and clean up resources."""
-        if self._browser:
-            self._browser.close()
-            self._browser = None
-        if self._playwright:
-            self._playwright.stop()
-            self._playwright = None
+        """Close the browser context and HTTP session and clean up resources."""
+        if self._http:
+            self._http.close()
+            self._http = None
+        self._close_context()
         self._auth_token = None
+        self._token_expires_at = None
@@ -6,18 +6,20 @@ Adapted from the original bill_manager.py scraping logic.
 """
 
 import base64
+import json
 import logging
 import os
 import re
+import time
 from pathlib import Path
 from typing import Optional
 
-from playwright.sync_api import Browser
 from playwright.sync_api import BrowserContext
 from playwright.sync_api import Page
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-from browser import USER_AGENT
+from browser import USER_AGENT, block_resources, shared_browser
+from cache import user_cache_path, write_cache_file
 
 log = logging.getLogger(__name__)
 
@@ -41,8 +43,27 @@ class SeattleUtilitiesScraper:
     AUTH_URL = "https://login.seattle.gov/authenticate"
     CAPTCHA_MODEL = "claude-opus-4-8"
     MAX_CAPTCHA_TRIES = 6
+    # A PDF button click that times out is retried in place (with backoff)
+    # instead of failing the bill
+    MAX_DOWNLOAD_TRIES = 3
+    DOWNLOAD_TIMEOUT = 30000  # ms per attempt, Playwright's default
     _CHALLENGE_MARKERS = ("code is in the image", "support id", "are a human")
     _CODE_RE = re.compile(r"^[A-Za-z0-9]{4,8}$")
+    # Billing history dates (MM/DD/YYYY); other rows are headers/totals
+    _BILL_DATE_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{4}")
+    # Stylesheets stay: the eportal hides/shows elements with CSS, which
+    # Playwright's actionability checks depend on. The CAPTCHA image is an
+    # inline data URI, so it never goes through the router.
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+    # [first cell text, amount (null if not a number)] per table row.
+    # Number() rejects trailing junk ("5.00 CR") like float() does.
+    _BILL_ROWS_JS = """
+        () => [...document.querySelectorAll('table.app-table tbody tr')].map(tr => {
+            const cells = tr.querySelectorAll('td');
+            const amount = Number((cells[1]?.innerText ?? "").replace(/[$,]/g, ""));
+            return [cells[0]?.innerText ?? "", Number.isFinite(amount) ? amount : null];
+        })
+    """
 
     def __init__(
         self,
@@ -69,27 +90,26 @@ class SeattleUtilitiesScraper:
         self.captcha_api_key = captcha_api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.headless = headless
 
-        self._playwright = None
-        self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
         self._logged_in = False
+        # True when the context was created from a saved session
+        self._session_restored = False
 
     def _ensure_browser(self):
-        """Ensure browser is initialized."""
-        if self._browser is None:
-            self._playwright = sync_playwright().start()
-            self._browser = self._playwright.chromium.launch(
-                headless=self.headless,
-                args=["--disable-blink-features=AutomationControlled"],
-                ignore_default_args=["--enable-automation"],
-            )
-            self._context = self._browser.new_context(
-                user_agent=USER_AGENT, viewport={"width": 1300, "height": 950}
+        """Ensure this instance has a browser context and page."""
+        if self._context is None:
+            saved_state = self._load_session_state()
+            self._session_restored = saved_state is not None
+            self._context = shared_browser(self.headless).new_context(
+                user_agent=USER_AGENT,
+                viewport={"width": 1300, "height": 950},
+                storage_state=saved_state,
             )
             self._context.add_init_script(
                 "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
             )
+            block_resources(self._context, self.BLOCKED_RESOURCE_TYPES)
             self._page = self._context.new_page()
 
     def _settle(self, timeout: int = 15000):
@@ -99,12 +119,58 @@ class SeattleUtilitiesScraper:
         except Exception:
             pass
 
+    def _session_state_path(self) -> Path:
+        """Per-user saved session file."""
+        return user_cache_path("seattle_session", self.username)
+
+    def _load_session_state(self) -> Optional[dict]:
+        """Return the cookies/localStorage saved after the last successful login."""
+        try:
+            return json.loads(self._session_state_path().read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _save_session_state(self):
+        """Persist the context's cookies/localStorage so the next run can skip SSO."""
+        try:
+            write_cache_file(self._session_state_path(), self._context.storage_state())
+        except Exception as e:
+            log.warning(f"Could not save session state: {e}")
+
+    def _resume_session(self) -> bool:
+        """Return True if the restored session still reaches the billing table."""
+        log.info("Trying saved session...")
+        try:
+            self._page.goto(
+                f"{self.BASE_URL}/eportal/#/billinghistory?acct={self.account}",
+                wait_until="domcontentloaded",
+            )
+            self._page.wait_for_selector("table.app-table", timeout=15000)
+            return True
+        except Exception:
+            log.info(f"Saved session rejected; current URL: {self._page.url}")
+            return False
+
     def _login(self):
         """Log in, solving the F5 CAPTCHA in the same context if we get blocked."""
         if self._logged_in:
             return
 
         self._ensure_browser()
+
+        if self._session_restored:
+            if self._resume_session():
+                self._logged_in = True
+                log.info("Resumed saved session, skipping SSO login")
+                return
+            # Start over in a clean context so stale cookies can't confuse SSO
+            try:
+                self._session_state_path().unlink()
+            except OSError:
+                pass
+            self.close()
+            self._ensure_browser()
+
         self._submit_login_form()
 
         if not self._await_eportal():
@@ -117,6 +183,7 @@ class SeattleUtilitiesScraper:
 
         self._settle()
         self._logged_in = True
+        self._save_session_state()
         log.info(f"Login successful, current URL: {self._page.url}")
 
     def _submit_login_form(self):
@@ -255,6 +322,19 @@ class SeattleUtilitiesScraper:
                 log.info(f"Found {self._page.locator('table').count()} tables on page")
             raise e
 
+    def _read_bill_rows(self) -> list[tuple[str, float]]:
+        """
+        Read the billing history table as (date, amount) tuples, skipping rows
+        whose first cell isn't exactly a MM/DD/YYYY date. Amounts that don't
+        parse come back as 0.0.
+        """
+        # One evaluate for the whole table instead of a round trip per cell
+        return [
+            (first_cell_text, float(amount) if amount is not None else 0.0)
+            for first_cell_text, amount in self._page.evaluate(self._BILL_ROWS_JS)
+            if self._BILL_DATE_RE.fullmatch(first_cell_text)
+        ]
+
     def check_for_new_bills(self) -> list[dict]:
         """
         Check for available bills in billing history.
@@ -265,31 +345,56 @@ class SeattleUtilitiesScraper:
         """
         self._navigate_to_billing_history()
 
-        # Get all bill rows, filtering out non-bill rows
-        all_rows = self._page.locator("table.app-table tbody tr").all()
-        bills = []
-
-        for row in all_rows:
-            first_cell_text = row.locator("td:first-child").inner_text()
-            # Skip rows that don't look like dates (MM/DD/YYYY format)
-            if "/" in first_cell_text and len(first_cell_text.split("/")) == 3:
-                # Try to get amount from second column
-                try:
-                    amount_text = row.locator("td:nth-child(2)").inner_text()
-                    amount = float(amount_text.replace("$", "").replace(",", ""))
-                except (ValueError, Exception):
-                    amount = 0.0
-
-                bills.append(
-                    {
-                        "date": first_cell_text,
-                        "amount": amount,
-                    }
-                )
+        bills = [
+            {
+                "date": bill_date,
+                "amount": amount,
+            }
+            for bill_date, amount in self._read_bill_rows()
+        ]
 
         log.info(f"Found {len(bills)} bills in billing history")
         return bills
 
+    def _open_bill_viewer(self, bill_date: str):
+        """Open the bill viewer for a bill by clicking its billing history row."""
+        # ViewBill.aspx carries no bill id; the bill shown is whichever row was
+        # clicked in this session, so there is no per-bill URL to go to directly
+        self._navigate_to_billing_history()
+
+        # Find and click the bill row for the specified date
+        first_cells = [row[0] for row in self._page.evaluate(self._BILL_ROWS_JS)]
+        if bill_date not in first_cells:
+            raise ValueError(f"Bill not found for date: {bill_date}")
+
+        log.info(f"Found bill for {bill_date}, navigating to viewer...")
+        rows = self._page.locator("table.app-table tbody tr")
+        rows.nth(first_cells.index(bill_date)).locator("a.view-bill-link").click()
+
+        # Wait for bill viewer page
+        self._page.wait_for_url("**/ViewBill.aspx", timeout=25000)
+
+    def _save_bill_pdf(self, temp_path: Path):
+        """Download the PDF from the open bill viewer to temp_path."""
+        for attempt in range(1, self.MAX_DOWNLOAD_TRIES + 1):
+            clicked = False
+            try:
+                timeout = self.DOWNLOAD_TIMEOUT
+                with self._page.expect_download(timeout=timeout) as download_info:
+                    self._page.locator("#main_divBillToolBar #main_PDF").click(timeout=timeout)
+                    clicked = True
+                break
+            except PlaywrightTimeoutError:
+                # Once the click lands the PDF is being generated; clicking
+                # again would only restart it, so a slow download isn't retried
+                if clicked or attempt == self.MAX_DOWNLOAD_TRIES:
+                    raise
+                delay = 0.5 * 2 ** (attempt - 1)
+                log.warning(f"PDF button click {attempt} timed out, retrying in {delay}s")
+                time.sleep(delay)
+
+        download_info.value.save_as(temp_path)
+
     def download_bill(self, bill_date: str) -> Path:
         """
         Download a specific bill by date.
@@ -300,31 +405,12 @@ class SeattleUtilitiesScraper:
         Returns:
             Path to the downloaded PDF file
         """
-        self._navigate_to_billing_history()
-
-        # Find and click the bill row for the specified date
-        all_rows = self._page.locator("table.app-table tbody tr").all()
-
-        for row in all_rows:
-            first_cell_text = row.locator("td:first-child").inner_text()
-            if first_cell_text == bill_date:
-                log.info(f"Found bill for {bill_date}, navigating to viewer...")
-                row.locator("a.view-bill-link").click()
-                break
-        else:
-            raise ValueError(f"Bill not found for date: {bill_date}")
-
-        # Wait for bill viewer page
-        self._page.wait_for_url("**/ViewBill.aspx", timeout=25000)
+        self._open_bill_viewer(bill_date)
 
         # Download PDF
         log.info("Downloading bill PDF...")
-        with self._page.expect_download() as download_info:
-            self._page.locator("#main_divBillToolBar #main_PDF").click()
-
-        download = download_info.value
         temp_path = Path(f"/tmp/bill_{bill_date.replace('/', '-')}.pdf")
-        download.save_as(temp_path)
+        self._save_bill_pdf(temp_path)
 
         log.info(f"Bill downloaded to: {temp_path}")
         return temp_path
@@ -338,14 +424,7 @@ class SeattleUtilitiesScraper:
         """
         self._navigate_to_billing_history()
 
-        # Get all bill rows
-        all_rows = self._page.locator("table.app-table tbody tr").all()
-        bill_rows = []
-
-        for row in all_rows:
-            first_cell_text = row.locator("td:first-child").inner_text()
-            if "/" in first_cell_text and len(first_cell_text.split("/")) == 3:
-                bill_rows.append(first_cell_text)
+        bill_rows = [bill_date for bill_date, _ in self._read_bill_rows()]
 
         log.info(f"Found {len(bill_rows)} bills to download")
 
@@ -354,46 +433,28 @@ class SeattleUtilitiesScraper:
             try:
                 log.info(f"Processing bill {i + 1}/{len(bill_rows)}: {bill_date}")
 
-                # Find and click the row for this date
-                all_rows = self._page.locator("table.app-table tbody tr").all()
-                for row in all_rows:
-                    if row.locator("td:first-child").inner_text() == bill_date:
-                        row.locator("a.view-bill-link").click()
-                        break
-
-                self._page.wait_for_url("**/ViewBill.aspx", timeout=25000)
+                self._open_bill_viewer(bill_date)
 
                 # Download PDF
-                with self._page.expect_download() as download_info:
-                    self._page.locator("#main_divBillToolBar #main_PDF").click()
-
-                download = download_info.value
                 temp_path = Path(f"/tmp/bill_{bill_date.replace('/', '-')}_{i}.pdf")
-                download.save_as(temp_path)
+                self._save_bill_pdf(temp_path)
 
                 downloaded.append((temp_path, bill_date))
                 log.info(f"Downloaded bill {bill_date}")
 
-                # Navigate back to billing history
-                self._navigate_to_billing_history()
-
             except Exception as e:
                 log.error(f"Error downloading bill {bill_date}: {e}")
-                # Try to recover by navigating back
-                try:
-                    self._navigate_to_billing_history()
-                except Exception:
-                    pass
 
         log.info(f"Successfully downloaded {len(downloaded)} bills")
         return downloaded
 
     def close(self):
-        """Close the browser and clean up resources."""
-        if self._browser:
-            self._browser.close()
-            self._browser = None
-        if self._playwright:
-            self._playwright.stop()
-            self._playwright = None
+        """Close this instance's browser context. The shared browser stays up."""
+        if self._context:
+            if self._logged_in:
+                # Pick up any cookies the portal rotated during this session
+                self._save_session_state()
+            self._context.close()
+            self._context = None
+            self._page = None
         self._logged_in = False
@@ -67,10 +67,12 @@ export function calculateInvoices(
   readings: Reading[],
   adjustments: Adjustment[]
 ): CalculatedInvoice[] {
-  // Get weights for distribution
-  const usageWeights = units.map(
-    (u) => readings.find((r) => r.unit_id === u.id)?.reading || 0
-  );
+  // Get weights for distribution (first reading per unit wins, as find() did)
+  const readingByUnit = new Map<string, number>();
+  for (const r of readings) {
+    if (!readingByUnit.has(r.unit_id)) readingByUnit.set(r.unit_id, r.reading);
+  }
+  const usageWeights = units.map((u) => readingByUnit.get(u.id) || 0);
   const sqftWeights = units.map((u) => u.sqft);
 
   // Collect all distributable items from water, sewer, and drainage services
@@ -142,10 +144,12 @@ export function calculateInvoices(
   }
 
   // Pre-calculate distributions for each item
-  // For usage-based items, pass sqftWeights as fallback for units with zero usage
+  // For usage-based items, units with zero usage fall back to their sqft weight;
+  // the combined weights are the same for every item, so build them once
+  const usageOrSqftWeights = withFallbackWeights(usageWeights, sqftWeights);
   const itemDistributions: number[][] = distributableItems.map((item) => {
     if (item.splitMethod === "usage") {
-      return distributeByWeight(item.cost, usageWeights, sqftWeights);
+      return distributeByWeight(item.cost, usageOrSqftWeights);
     } else {
       return distributeByWeight(item.cost, sqftWeights);
     }
@@ -248,33 +252,37 @@ function distributeEvenly(total: number, count: number): number[] {
   return amounts;
 }
 
+/**
+ * Calculate effective weights: use primary weight if > 0, else fallback weight.
+ * This allows units with zero usage to fall back to sqft-based distribution.
+ */
+function withFallbackWeights(weights: number[], fallbackWeights: number[]): number[] {
+  return weights.map((w, i) => {
+    if (w > 0) return w;
+    if (fallbackWeights[i] > 0) return fallbackWeights[i];
+    return 0;
+  });
+}
+
 /**
  * Distribute a total amount among recipients with different weights.
  * Uses largest remainder method to ensure the sum equals exactly the total.
  *
  * @param total - The total amount to distribute
- * @param weights - Array of weights (e.g., water usage in gallons)
- * @param fallbackWeights - Optional fallback weights to use for recipients with zero primary weight
+ * @param weights - Array of weights (e.g., water usage in gallons, with any
+ *   fallback already applied by withFallbackWeights)
  * @returns Array of amounts that sum to exactly total
  */
-function distributeByWeight(total: number, weights: number[], fallbackWeights?: number[]): number[] {
+function distributeByWeight(total: number, weights: number[]): number[] {
   if (weights.length === 0) return [];
   
-  // Calculate effective weights: use primary weight if > 0, else fallback weight
-  // This allows units with zero usage to fall back to sqft-based distribution
-  const effectiveWeights = weights.map((w, i) => {
-    if (w > 0) return w;
-    if (fallbackWeights && fallbackWeights[i] > 0) return fallbackWeights[i];
-    return 0;
-  });
-  
-  const totalWeight = effectiveWeights.reduce((sum, w) => sum + w, 0);
+  const totalWeight = weights.reduce((sum, w) => sum + w, 0);
   if (totalWeight <= 0) return weights.map(() => 0);
   
   const totalCents = Math.round(total * 100);
   
   // Calculate exact shares and their remainders
-  const shares = effectiveWeights.map(w => {
+  const shares = weights.map(w => {
     const exactShare = (w / totalWeight) * totalCents;
     const floored = Math.floor(exactShare);
     const remainder = exactShare - floored;
@@ -783,9 +791,14 @@ export function calculateInvoicesWithSolidWaste(
   // Get base invoices without solid waste
   const baseInvoices = calculateInvoices(bill, units, readings, adjustments);
 
+  const assignmentByUnit = new Map<string, SolidWasteAssignment>();
+  for (const a of solidWasteAssignments) {
+    if (!assignmentByUnit.has(a.unit_id)) assignmentByUnit.set(a.unit_id, a);
+  }
+
   // Add solid waste charges to each invoice
   const invoicesWithSolidWaste = baseInvoices.map((invoice) => {
-    const swa = solidWasteAssignments.find((a) => a.unit_id === invoice.unit_id);
+    const swa = assignmentByUnit.get(invoice.unit_id);
     if (!swa) return invoice;
 
     const newLineItems = [...invoice.line_items];